@@ -5,15 +5,17 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+import csv
+import os
 import tempfile
 import unittest
 from typing import Any, List, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from torchtnt.runner._test_utils import DummyPredictUnit, generate_random_dataloader
 from torchtnt.runner.callbacks.base_csv_writer import BaseCSVWriter
 from torchtnt.runner.predict import predict
-from torchtnt.runner.state import State
+from torchtnt.runner.state import EntryPoint, PhaseState, State
 from torchtnt.runner.unit import PredictUnit, TPredictData
 
 _HEADER_ROW = ["output"]
@@ -40,6 +42,28 @@ class CustomCSVWriterSingleRow(BaseCSVWriter):
         return ["1"]
 
 
+class CustomCSVWriterExplicitSingleRow(BaseCSVWriter):
+    multi_row = False
+
+    def get_batch_output_rows(
+        self,
+        state: State,
+        unit: PredictUnit[TPredictData],
+        step_output: Any,
+    ) -> Union[List[str], List[List[str]]]:
+        return ["1", "2"]
+
+
+class CustomCSVWriterQuotedRows(BaseCSVWriter):
+    def get_batch_output_rows(
+        self,
+        state: State,
+        unit: PredictUnit[TPredictData],
+        step_output: Any,
+    ) -> Union[List[str], List[List[str]]]:
+        return [["1", "a\tb"], ["2", 'c"d'], ["3", "e\rf"]]
+
+
 class BaseCSVWriterTest(unittest.TestCase):
     def test_csv_writer(self) -> None:
         """
@@ -85,6 +109,28 @@ class BaseCSVWriterTest(unittest.TestCase):
             self.assertEqual(csv_callback.output_path, csv_file)
             self.assertIsNotNone(csv_callback._file)
 
+    def test_csv_writer_explicit_single_row(self) -> None:
+        """
+        Test BaseCSVWriter callback with multi_row declared as False by the subclass
+        """
+        input_dim = 2
+        dataset_len = 10
+        batch_size = 2
+
+        my_unit = MagicMock(spec=DummyPredictUnit)
+        dataloader = generate_random_dataloader(dataset_len, input_dim, batch_size)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriterExplicitSingleRow(
+                header_row=["a", "b"], dir_path=temp_dir, filename=_FILENAME
+            )
+            predict(my_unit, dataloader, callbacks=[csv_callback])
+
+            self.assertFalse(csv_callback.multi_row)
+            with open(f"{temp_dir}/{_FILENAME}", newline="") as f:
+                rows = list(csv.reader(f, delimiter="\t"))
+            self.assertEqual(rows, [["a", "b"]] + [["1", "2"]] * 5)
+
     def test_csv_writer_with_no_output_rows_def(self) -> None:
         """
         Test BaseCSVWriter callback without output defined
@@ -102,3 +148,138 @@ class BaseCSVWriterTest(unittest.TestCase):
                 header_row=_HEADER_ROW, dir_path="", filename=_FILENAME
             )
             predict(my_unit, dataloader, callbacks=[csv_callback])
+
+    def test_csv_writer_flush_threshold(self) -> None:
+        """
+        Test BaseCSVWriter callback flushes output to disk once flush_threshold bytes were written
+        """
+        my_unit = MagicMock(spec=DummyPredictUnit)
+        state = State(
+            entry_point=EntryPoint.PREDICT,
+            predict_state=PhaseState(dataloader=[]),
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriter(
+                header_row=_HEADER_ROW,
+                dir_path=temp_dir,
+                filename=_FILENAME,
+                flush_threshold=10,
+            )
+            csv_file = f"{temp_dir}/{_FILENAME}"
+
+            # header row "output\n" stays below the threshold
+            csv_callback.on_predict_start(state, my_unit)
+            self.assertEqual(csv_callback._bytes_since_flush, 7)
+
+            # rows "1\n2\n" cross the threshold and trigger a flush
+            csv_callback.on_predict_step_end(state, my_unit)
+            self.assertEqual(csv_callback._bytes_since_flush, 0)
+            with open(csv_file) as f:
+                self.assertEqual(f.read(), "output\n1\n2\n")
+
+            csv_callback.on_predict_end(state, my_unit)
+
+    @patch(
+        "torchtnt.runner.callbacks.base_csv_writer.get_global_rank", return_value=1
+    )
+    def test_csv_writer_non_zero_rank(self, _: MagicMock) -> None:
+        """
+        Test BaseCSVWriter callback neither opens nor writes the file on non-zero ranks
+        """
+        input_dim = 2
+        dataset_len = 10
+        batch_size = 2
+
+        my_unit = MagicMock(spec=DummyPredictUnit)
+        dataloader = generate_random_dataloader(dataset_len, input_dim, batch_size)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriter(
+                header_row=_HEADER_ROW, dir_path=temp_dir, filename=_FILENAME
+            )
+            with patch.object(csv_callback, "_write_rows") as write_rows:
+                predict(my_unit, dataloader, callbacks=[csv_callback])
+                write_rows.assert_not_called()
+
+            self.assertIsNone(csv_callback._file)
+            self.assertFalse(os.path.exists(f"{temp_dir}/{_FILENAME}"))
+
+    def test_csv_writer_lazy_open(self) -> None:
+        """
+        Test BaseCSVWriter callback does not create the file until prediction starts
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriter(
+                header_row=_HEADER_ROW, dir_path=temp_dir, filename=_FILENAME
+            )
+
+            self.assertIsNone(csv_callback._file)
+            self.assertFalse(os.path.exists(f"{temp_dir}/{_FILENAME}"))
+
+    def test_csv_writer_quoted_rows(self) -> None:
+        """
+        Test BaseCSVWriter callback falls back to csv quoting for fields with special characters
+        """
+        input_dim = 2
+        dataset_len = 2
+        batch_size = 2
+
+        my_unit = MagicMock(spec=DummyPredictUnit)
+        dataloader = generate_random_dataloader(dataset_len, input_dim, batch_size)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriterQuotedRows(
+                header_row=["id", "output"], dir_path=temp_dir, filename=_FILENAME
+            )
+            predict(my_unit, dataloader, callbacks=[csv_callback])
+
+            with open(f"{temp_dir}/{_FILENAME}", newline="") as f:
+                rows = list(csv.reader(f, delimiter="\t"))
+            self.assertEqual(
+                rows,
+                [["id", "output"], ["1", "a\tb"], ["2", 'c"d'], ["3", "e\rf"]],
+            )
+
+    def test_csv_writer_close_is_idempotent(self) -> None:
+        """
+        Test BaseCSVWriter callback does not fail when tearing down an already closed file
+        """
+        input_dim = 2
+        dataset_len = 10
+        batch_size = 2
+
+        my_unit = MagicMock(spec=DummyPredictUnit)
+        dataloader = generate_random_dataloader(dataset_len, input_dim, batch_size)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriter(
+                header_row=_HEADER_ROW, dir_path=temp_dir, filename=_FILENAME
+            )
+            predict(my_unit, dataloader, callbacks=[csv_callback])
+
+            state = State(entry_point=EntryPoint.PREDICT)
+            csv_callback.on_exception(state, my_unit, RuntimeError())
+            csv_callback.on_predict_end(state, my_unit)
+
+            self.assertTrue(csv_callback._closed)
+            with open(f"{temp_dir}/{_FILENAME}") as f:
+                self.assertEqual(f.read(), "output\n" + "1\n2\n" * 5)
+
+    def test_csv_writer_close_unopened(self) -> None:
+        """
+        Test BaseCSVWriter callback teardown is a no-op when the file was never opened
+        """
+        my_unit = MagicMock(spec=DummyPredictUnit)
+        state = State(entry_point=EntryPoint.PREDICT)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_callback = CustomCSVWriter(
+                header_row=_HEADER_ROW, dir_path=temp_dir, filename=_FILENAME
+            )
+            csv_callback.on_exception(state, my_unit, RuntimeError())
+            csv_callback.on_predict_end(state, my_unit)
+
+            self.assertIsNone(csv_callback._file)
+            self.assertFalse(csv_callback._closed)
+            self.assertFalse(os.path.exists(f"{temp_dir}/{_FILENAME}"))
@@ -6,7 +6,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from torchtnt.runner._test_utils import (
     DummyEvalUnit,
@@ -19,6 +19,7 @@ from torchtnt.runner.callbacks.tqdm_progress_bar import (
     TQDMProgressBar,
 )
 from torchtnt.runner.state import EntryPoint, PhaseState, State
+from tqdm.auto import tqdm
 
 
 class TQDMProgressBarTest(unittest.TestCase):
@@ -94,6 +95,47 @@ class TQDMProgressBarTest(unittest.TestCase):
         progress_bar.on_predict_epoch_start(state, my_unit)
         self.assertEqual(progress_bar._predict_progress_bar.total, expected_total)
 
+    def test_progress_bar_update(self) -> None:
+        """
+        Test TQDMProgressBar callback updates by one each step and lets tqdm throttle redraws
+        """
+        input_dim = 2
+        dataset_len = 10
+        batch_size = 2
+        max_epochs = 1
+        refresh_rate = 2
+        num_steps = dataset_len // batch_size
+
+        dataloader = generate_random_dataloader(dataset_len, input_dim, batch_size)
+        state = State(
+            entry_point=EntryPoint.TRAIN,
+            train_state=PhaseState(
+                dataloader=dataloader,
+                max_epochs=max_epochs,
+            ),
+        )
+
+        my_unit = MagicMock(spec=DummyTrainUnit)
+        progress_bar = TQDMProgressBar(refresh_rate=refresh_rate)
+        with patch(
+            "torchtnt.runner.callbacks.tqdm_progress_bar.tqdm", wraps=tqdm
+        ) as mock_tqdm:
+            progress_bar.on_train_epoch_start(state, my_unit)
+        self.assertEqual(mock_tqdm.call_args.kwargs["miniters"], refresh_rate)
+
+        train_progress_bar = progress_bar._train_progress_bar
+        with patch.object(
+            train_progress_bar, "update", wraps=train_progress_bar.update
+        ) as mock_update:
+            for _ in range(num_steps):
+                progress_bar.on_train_step_end(state, my_unit)
+        self.assertEqual(mock_update.call_count, num_steps)
+        for call in mock_update.call_args_list:
+            self.assertEqual(call.args, (1,))
+
+        progress_bar.on_train_epoch_end(state, my_unit)
+        self.assertEqual(train_progress_bar.n, num_steps)
+
     def test_estimated_steps_in_epoch(self) -> None:
         """
         Test TQDMProgressBar's _estimate_steps_in_epoch function
@@ -142,3 +184,11 @@ class TQDMProgressBarTest(unittest.TestCase):
             ),
             dataloader_size,
         )
+        self.assertIsNone(
+            _estimated_steps_in_epoch(
+                iter(dataloader),
+                num_steps_completed=0,
+                max_steps=None,
+                max_steps_per_epoch=None,
+            )
+        )
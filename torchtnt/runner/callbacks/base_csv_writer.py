@@ -5,9 +5,10 @@
 # LICENSE file in the root directory of this source tree.
 
 import csv
+import io
 import os
 from abc import ABC, abstractmethod
-from typing import Any, List, TextIO, Union
+from typing import Any, BinaryIO, List, Optional, Union
 
 from torchtnt.runner.callback import Callback
 from torchtnt.runner.state import EntryPoint, State
@@ -22,6 +23,7 @@ from torchtnt.runner.unit import (
 from torchtnt.utils import get_filesystem, get_global_rank
 
 DEFAULT_FILE_NAME = "predictions.csv"
+DEFAULT_FLUSH_THRESHOLD: int = 4 << 20
 
 
 class BaseCSVWriter(Callback, ABC):
@@ -32,32 +34,48 @@ class BaseCSVWriter(Callback, ABC):
     into a CSV file. This callback must be extended with an implementation for
     ``get_batch_output_rows`` to write the desired outputs as rows in the CSV file.
 
-    By default, outputs at each step across all processes will be written into the same CSV file.
+    Only the rank 0 process opens and writes to the CSV file in distributed environments.
     The outputs in each row is a a list of strings, and should match
     the columns names defined in ``header_row``.
 
+    Subclasses can set ``multi_row`` to declare whether ``get_batch_output_rows`` returns
+    a list of rows (``True``) or a single row (``False``). If left as ``None``, this is
+    detected from the first non-empty output and reused for the rest of prediction.
+
     Args:
         header_row: columns of the CSV file
         dir_path: directory path of where to save the CSV file
         delimiter: separate columns in one row. Default is tab
         filename: name of the file. Default filename is "predictions.csv"
+        flush_threshold: number of bytes written after which the file is flushed.
+            Bounds how much output is lost if the process crashes. Default is 4 MiB
     """
 
+    multi_row: Optional[bool] = None
+
     def __init__(
         self,
         header_row: List[str],
         dir_path: str,
         delimiter: str = "\t",
         filename: str = DEFAULT_FILE_NAME,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
     ) -> None:
         super().__init__()
         self.header_row = header_row
         self.delimiter = delimiter
+        self._flush_threshold = flush_threshold
+        self._bytes_since_flush = 0
 
         self.output_path: str = os.path.join(dir_path, filename)
-        fs = get_filesystem(self.output_path)
-        self._file: TextIO = fs.open(self.output_path, mode="a")
-        self._writer: csv._writer = csv.writer(self._file, delimiter=delimiter)
+        self._is_rank_zero: bool = get_global_rank() == 0
+        # opened lazily on first use so unused writers never touch the filesystem
+        self._file: Optional[BinaryIO] = None
+        self._closed = False
+        # rows needing quoting are formatted by csv.writer into this buffer, then encoded.
+        # The default "\r\n" terminator is kept so fields containing "\r" get quoted.
+        self._quoted_buffer = io.StringIO()
+        self._writer: csv._writer = csv.writer(self._quoted_buffer, delimiter=delimiter)
 
     @abstractmethod
     def get_batch_output_rows(
@@ -70,27 +88,80 @@ class BaseCSVWriter(Callback, ABC):
         ...
 
     def on_predict_start(self, state: State, unit: PredictUnit[TPredictData]) -> None:
-        if get_global_rank() == 0:
-            self._writer.writerow(self.header_row)
+        if not self._is_rank_zero:
+            return
+        self._ensure_open()
+        self._write_rows([self.header_row])
 
     def on_predict_step_end(
         self, state: State, unit: PredictUnit[TPredictData]
     ) -> None:
+        if not self._is_rank_zero:
+            return
+        self._ensure_open()
         assert state.predict_state is not None
         step_output = state.predict_state.step_output
         batch_output_rows = self.get_batch_output_rows(state, unit, step_output)
 
-        # Check whether the first item is a list or not
         if len(batch_output_rows) > 0:
-            if isinstance(batch_output_rows[0], list):
-                for row in batch_output_rows:
-                    self._writer.writerow(row)
+            if self.multi_row is None:
+                # Check whether the first item is a list or not
+                self.multi_row = isinstance(batch_output_rows[0], list)
+            if self.multi_row:
+                # pyre-ignore: Incompatible parameter type [6]
+                self._write_rows(batch_output_rows)
             else:
-                self._writer.writerow(batch_output_rows)
+                # pyre-ignore: Incompatible parameter type [6]
+                self._write_rows([batch_output_rows])
+
+    def _ensure_open(self) -> None:
+        if self._file is None or self._closed:
+            fs = get_filesystem(self.output_path)
+            self._file = fs.open(self.output_path, mode="ab")
+            self._closed = False
+            self._bytes_since_flush = 0
+
+    def _write_rows(self, rows: List[List[str]]) -> None:
+        """
+        Encodes ``rows`` and writes them with a single call to the underlying file,
+        flushing it once ``flush_threshold`` bytes were written since the last flush.
+        """
+        output = "".join([self._format_row(row) for row in rows]).encode("utf-8")
+        # pyre-ignore: Undefined attribute [16]
+        self._file.write(output)
+        self._bytes_since_flush += len(output)
+        if self._bytes_since_flush >= self._flush_threshold:
+            # pyre-ignore: Undefined attribute [16]
+            self._file.flush()
+            self._bytes_since_flush = 0
+
+    def _format_row(self, row: List[str]) -> str:
+        """
+        Returns ``row`` as a line of the CSV file. Rows of plain strings are joined
+        directly, anything ``csv.writer`` would quote or convert goes through it.
+        """
+        try:
+            line = self.delimiter.join(row)
+        except TypeError:
+            line = None
+        if (
+            line is None
+            or line.count(self.delimiter) != len(row) - 1
+            or '"' in line
+            or "\r" in line
+            or "\n" in line
+            # csv.writer quotes a row made of a single empty field
+            or (len(row) == 1 and not line)
+        ):
+            self._writer.writerow(row)
+            line = self._quoted_buffer.getvalue()
+            self._quoted_buffer.seek(0)
+            self._quoted_buffer.truncate()
+            return line[: -len(self._writer.dialect.lineterminator)] + "\n"
+        return line + "\n"
 
     def on_predict_end(self, state: State, unit: PredictUnit[TPredictData]) -> None:
-        self._file.flush()
-        self._file.close()
+        self._close()
 
     def on_exception(
         self,
@@ -101,5 +172,14 @@ class BaseCSVWriter(Callback, ABC):
         exc: BaseException,
     ) -> None:
         if state.entry_point == EntryPoint.PREDICT:
-            self._file.flush()
-            self._file.close()
+            self._close()
+
+    def _close(self) -> None:
+        # no-op on non-zero ranks, unused writers, and files already closed
+        if self._closed or self._file is None:
+            return
+        # pyre-ignore: Undefined attribute [16]
+        self._file.flush()
+        # pyre-ignore: Undefined attribute [16]
+        self._file.close()
+        self._closed = True
@@ -27,10 +27,11 @@ class TQDMProgressBar(Callback):
     It is initialized only on rank 0 in distributed environments.
 
     Args:
-        refresh_rate: Determines at which rate (in number of steps) the progress bars get updated.
+        refresh_rate: Determines at which rate (in number of steps) the progress bars get redrawn.
     """
 
     def __init__(self, refresh_rate: int = 1) -> None:
+        self._is_rank_zero: bool = get_global_rank() == 0
         self._refresh_rate = refresh_rate
 
         self._train_progress_bar: Optional[tqdm] = None
@@ -38,6 +39,8 @@ class TQDMProgressBar(Callback):
         self._predict_progress_bar: Optional[tqdm] = None
 
     def on_train_epoch_start(self, state: State, unit: TrainUnit[TTrainData]) -> None:
+        if not self._is_rank_zero:
+            return
         if state.train_state:
             self._train_progress_bar = _create_progress_bar(
                 state.train_state.dataloader,
@@ -46,25 +49,24 @@ class TQDMProgressBar(Callback):
                 num_steps_completed=state.train_state.progress.num_steps_completed,
                 max_steps=state.train_state.max_steps,
                 max_steps_per_epoch=state.train_state.max_steps_per_epoch,
+                refresh_rate=self._refresh_rate,
             )
 
     def on_train_step_end(self, state: State, unit: TrainUnit[TTrainData]) -> None:
-        if self._train_progress_bar and state.train_state:
-            _update_progress_bar(
-                self._train_progress_bar,
-                state.train_state.progress.num_steps_completed,
-                self._refresh_rate,
-            )
+        if not self._is_rank_zero:
+            return
+        if self._train_progress_bar:
+            _update_progress_bar(self._train_progress_bar)
 
     def on_train_epoch_end(self, state: State, unit: TrainUnit[TTrainData]) -> None:
-        if self._train_progress_bar and state.train_state:
-            _close_progress_bar(
-                self._train_progress_bar,
-                state.train_state.progress.num_steps_completed,
-                self._refresh_rate,
-            )
+        if not self._is_rank_zero:
+            return
+        if self._train_progress_bar:
+            _close_progress_bar(self._train_progress_bar)
 
     def on_eval_epoch_start(self, state: State, unit: EvalUnit[TEvalData]) -> None:
+        if not self._is_rank_zero:
+            return
         if state.eval_state:
             self._eval_progress_bar = _create_progress_bar(
                 state.eval_state.dataloader,
@@ -73,27 +75,26 @@ class TQDMProgressBar(Callback):
                 num_steps_completed=state.eval_state.progress.num_steps_completed,
                 max_steps=state.eval_state.max_steps,
                 max_steps_per_epoch=state.eval_state.max_steps_per_epoch,
+                refresh_rate=self._refresh_rate,
             )
 
     def on_eval_step_end(self, state: State, unit: EvalUnit[TEvalData]) -> None:
-        if self._eval_progress_bar and state.eval_state:
-            _update_progress_bar(
-                self._eval_progress_bar,
-                state.eval_state.progress.num_steps_completed,
-                self._refresh_rate,
-            )
+        if not self._is_rank_zero:
+            return
+        if self._eval_progress_bar:
+            _update_progress_bar(self._eval_progress_bar)
 
     def on_eval_epoch_end(self, state: State, unit: EvalUnit[TEvalData]) -> None:
-        if self._eval_progress_bar and state.eval_state:
-            _close_progress_bar(
-                self._eval_progress_bar,
-                state.eval_state.progress.num_steps_completed,
-                self._refresh_rate,
-            )
+        if not self._is_rank_zero:
+            return
+        if self._eval_progress_bar:
+            _close_progress_bar(self._eval_progress_bar)
 
     def on_predict_epoch_start(
         self, state: State, unit: PredictUnit[TPredictData]
     ) -> None:
+        if not self._is_rank_zero:
+            return
         if state.predict_state:
             self._predict_progress_bar = _create_progress_bar(
                 state.predict_state.dataloader,
@@ -102,27 +103,24 @@ class TQDMProgressBar(Callback):
                 num_steps_completed=state.predict_state.progress.num_steps_completed,
                 max_steps=state.predict_state.max_steps,
                 max_steps_per_epoch=state.predict_state.max_steps_per_epoch,
+                refresh_rate=self._refresh_rate,
             )
 
     def on_predict_step_end(
         self, state: State, unit: PredictUnit[TPredictData]
     ) -> None:
-        if self._predict_progress_bar and state.predict_state:
-            _update_progress_bar(
-                self._predict_progress_bar,
-                state.predict_state.progress.num_steps_completed,
-                self._refresh_rate,
-            )
+        if not self._is_rank_zero:
+            return
+        if self._predict_progress_bar:
+            _update_progress_bar(self._predict_progress_bar)
 
     def on_predict_epoch_end(
         self, state: State, unit: PredictUnit[TPredictData]
     ) -> None:
-        if self._predict_progress_bar and state.predict_state:
-            _close_progress_bar(
-                self._predict_progress_bar,
-                state.predict_state.progress.num_steps_completed,
-                self._refresh_rate,
-            )
+        if not self._is_rank_zero:
+            return
+        if self._predict_progress_bar:
+            _close_progress_bar(self._predict_progress_bar)
 
 
 def _create_progress_bar(
@@ -134,10 +132,8 @@ def _create_progress_bar(
     num_steps_completed: int,
     max_steps: Optional[int],
     max_steps_per_epoch: Optional[int],
-) -> Optional[tqdm]:
-    if not get_global_rank() == 0:
-        return None
-
+    refresh_rate: int = 1,
+) -> tqdm:
     current_epoch = num_epochs_completed
     total = _estimated_steps_in_epoch(
         dataloader,
@@ -145,28 +141,20 @@ def _create_progress_bar(
         max_steps=max_steps,
         max_steps_per_epoch=max_steps_per_epoch,
     )
-    return tqdm(desc=f"{desc} {current_epoch}", total=total)
-
-
-def _update_progress_bar(
-    progress_bar: tqdm, num_steps_completed: int, refresh_rate: int
-) -> None:
-    if not get_global_rank() == 0:
-        return
+    return tqdm(
+        desc=f"{desc} {current_epoch}",
+        total=total,
+        miniters=refresh_rate,
+        mininterval=0.1,
+    )
 
-    if (num_steps_completed + 1) % refresh_rate == 0:
-        progress_bar.update(refresh_rate)
 
+def _update_progress_bar(progress_bar: tqdm) -> None:
+    # tqdm throttles redraws itself based on miniters and mininterval
+    progress_bar.update(1)
 
-def _close_progress_bar(
-    progress_bar: tqdm, num_steps_completed: int, refresh_rate: int
-) -> None:
-    if not get_global_rank() == 0:
-        return
 
-    progress_bar.update(
-        num_steps_completed % refresh_rate
-    )  # complete remaining progress in bar
+def _close_progress_bar(progress_bar: tqdm) -> None:
     progress_bar.close()
 
 
@@ -177,17 +165,20 @@ def _estimated_steps_in_epoch(
     num_steps_completed: int,
     max_steps: Optional[int],
     max_steps_per_epoch: Optional[int],
-) -> float:
-    """estimate number of steps in current epoch for tqdm"""
-
-    total = float("inf")
-    if isinstance(dataloader, Sized):
-        total = len(dataloader)
+) -> Optional[int]:
+    """estimate number of steps in current epoch for tqdm, or None if unknown"""
 
-    if max_steps_per_epoch and max_steps:
-        total = min(total, max_steps_per_epoch, max_steps - num_steps_completed)
-    elif max_steps:
-        total = min(total, max_steps - num_steps_completed)
+    if max_steps:
+        total = max_steps - num_steps_completed
+        if max_steps_per_epoch and max_steps_per_epoch < total:
+            total = max_steps_per_epoch
     elif max_steps_per_epoch:
-        total = min(total, max_steps_per_epoch)
+        total = max_steps_per_epoch
+    elif isinstance(dataloader, Sized):
+        return len(dataloader)
+    else:
+        return None
+
+    if isinstance(dataloader, Sized):
+        return min(total, len(dataloader))
     return total